@@ -1,16 +1,20 @@
 # board.py ── loads cell-art styles from every JSON file in styles/cells/
 # ----------------------------------------------------------------------
-import json
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from StyleLoader import STYLES_DIR, load_style_dir
 
 # ──────────────────────────────────────────────────────────────────────
 # Paths
 # ──────────────────────────────────────────────────────────────────────
-STYLES_DIR   = Path(__file__).parent / "styles"
 CELLS_DIR    = STYLES_DIR / "cells"          # each *.json may hold one or many styles
 SKELETON_DIR = STYLES_DIR / "skeletons"      # reserved for future use
 
+# Keys every cell style must define
+_REQUIRED_CELL = frozenset(("top", "mid", "bottom"))
+
 
 # ──────────────────────────────────────────────────────────────────────
 # Helper – load all cell styles once
@@ -39,49 +43,19 @@ def _load_cell_styles(directory: Path = CELLS_DIR) -> Dict[str, Dict[str, str]]:
     * Every style dict must contain exactly the keys 'top', 'mid', 'bottom'.
     * After scanning all files there must be a style named 'default'.
     """
-    if not directory.is_dir():
-        raise FileNotFoundError(f"Styles folder not found: {directory}")
-
-    required = {"top", "mid", "bottom"}
-    style_map: Dict[str, Dict[str, str]] = {}
-
-    for fp in directory.glob("*.json"):
-        with fp.open(encoding="utf-8") as f:
-            data = json.load(f)
-
-        # ---- Case A: file defines ONE style (root has top/mid/bottom) ----
-        if required.issubset(data):
-            style_name = fp.stem
-            if style_name in style_map:
-                raise ValueError(
-                    f"Duplicate style name '{style_name}' found again in {fp.name}"
-                )
-            style_map[style_name] = {k: data[k] for k in required}
-            continue
-
-        # ---- Case B: file bundles MANY styles ---------------------------
-        for style_name, parts in data.items():
-            if style_name in style_map:
-                raise ValueError(
-                    f"Duplicate style name '{style_name}' (also in {fp.name})"
-                )
-            missing = required - parts.keys()
-            if missing:
-                raise ValueError(
-                    f"Style '{style_name}' in {fp.name} missing keys: {', '.join(missing)}"
-                )
-            style_map[style_name] = {k: parts[k] for k in required}
-
-    if "default" not in style_map:
-        raise ValueError(
-            'At least one JSON in styles/cells/ must provide a style named "default".'
-        )
+    return load_style_dir(directory, _REQUIRED_CELL)
 
-    return style_map
 
+# Parsed lazily on first use, so importing this module touches no files.
+_STYLE_MAP: Optional[Dict[str, Dict[str, str]]] = None
 
-# Parsed exactly once at import time
-_STYLE_MAP: Dict[str, Dict[str, str]] = _load_cell_styles()
+
+def _get_style_map() -> Dict[str, Dict[str, str]]:
+    """Returns the shared cell style map, loading it on first access."""
+    global _STYLE_MAP
+    if _STYLE_MAP is None:
+        _STYLE_MAP = _load_cell_styles()
+    return _STYLE_MAP
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -101,6 +75,27 @@ class Board:
 
     _CELL_LINE_ORDER = ("top", "mid", "bottom")
 
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access.
+    __slots__ = (
+        "rows",
+        "columns",
+        "color",
+        "_parts",
+        "_top_line",
+        "_bot_line",
+        "_row_labels",
+        "_footer",
+        "_mid_template",
+        "board",
+        "_blank",
+        "_codes",
+        "_tokens",
+        "_stride",
+        "_shifts",
+        "_bb",
+        "_heights",
+    )
+
     def __init__(
         self,
         color: str,
@@ -108,24 +103,95 @@ class Board:
         columns: int = 7,
         style: str = "default",
     ) -> None:
-        self.rows: int = rows
-        self.columns: int = columns
-        self.color: str = color  # Metadata, not currently used for rendering.
-
+        style_map = _get_style_map()
         try:
-            # _parts holds the ASCII/Unicode strings for the chosen cell style.
-            self._parts = _STYLE_MAP[style]
+            # parts holds the ASCII/Unicode strings for the chosen cell style.
+            parts = style_map[style]
         except KeyError as exc:
             raise ValueError(
                 f"Unknown style '{style}'. "
-                f"Available: {', '.join(sorted(_STYLE_MAP))}"
+                f"Available: {', '.join(sorted(style_map))}"
             ) from exc
 
-        # The logical board is a 2D list (list of lists).
-        # `None` represents an empty cell. It will be filled with piece strings ('X', 'O').
-        self.board: List[List[Optional[str]]] = [
-            [None for _ in range(columns)] for _ in range(rows)
-        ]
+        self.rows: int = rows
+        self.columns: int = columns
+        self.color: str = color  # Metadata, not currently used for rendering.
+        self._parts: Dict[str, str] = parts
+
+        # The cell art never changes for the lifetime of a board, so the
+        # top/bottom lines and the middle-line template are built once here
+        # instead of on every print_board() call.
+        top_part = self._parts["top"]
+        mid_part = self._parts["mid"]
+        bot_part = self._parts["bottom"]
+        center_idx = len(mid_part) // 2
+
+        # To ensure the board aligns nicely, the row labels (e.g., "5: ") are
+        # right-aligned to a common width, and the lines without a label get
+        # the same amount of padding in front.
+        row_label_width = len(str(rows - 1))
+        row_prefix_padding = " " * (row_label_width + 2)  # e.g., for "5: "
+        self._row_labels: Tuple[str, ...] = tuple(
+            f"{r:>{row_label_width}}: " for r in range(rows)
+        )
+
+        self._top_line: str = row_prefix_padding + " ".join([top_part] * columns)
+        self._bot_line: str = row_prefix_padding + " ".join([bot_part] * columns)
+
+        # Column index footer, after a blank spacer line. Each index is
+        # centered within the width of a single cell.
+        col_labels = [str(c).center(len(mid_part)) for c in range(columns)]
+        self._footer: str = "\n" + row_prefix_padding + " ".join(col_labels)
+
+        # Each cell's center char becomes a "{}" slot; literal braces in the
+        # style art are escaped so str.format() leaves them alone.
+        mid_left = mid_part[:center_idx].replace("{", "{{").replace("}", "}}")
+        mid_right = mid_part[center_idx + 1:].replace("{", "{{").replace("}", "}}")
+        self._mid_template: str = " ".join([mid_left + "{}" + mid_right] * columns)
+
+        # The logical board is a flat bytearray, addressed as board[r * columns + c].
+        # 0 represents an empty cell. Any other value is a piece code, handed out
+        # the first time a piece string is dropped (1 = first piece, 2 = second).
+        self.board: bytearray = bytearray(rows * columns)
+        self._blank: bytes = bytes(rows * columns)  # zero image used by reset_board()
+
+        # Translation between piece strings ('X', 'O') and their byte codes.
+        # _tokens[code] is what gets rendered, so code 0 maps to a blank.
+        self._codes: Dict[str, int] = {}
+        self._tokens: List[str] = [" "]
+
+        # Win detection works on bitboards: one int per piece code, where
+        # (column c, height h) maps to bit c * stride + h. The stride leaves one
+        # always-empty sentinel bit on top of every column, so shifted lines
+        # can never wrap from one column into the next.
+        # _heights[c] is the number of pieces already stacked in column c.
+        self._stride: int = rows + 1
+        self._shifts = (
+            1,  # Vertical
+            self._stride,  # Horizontal
+            self._stride - 1,  # Diagonal down-right
+            self._stride + 1,  # Diagonal down-left
+        )
+        self._bb: List[int] = [0]  # index 0 (empty) is never set
+        self._heights: List[int] = [0] * columns
+
+    def clone(self) -> "Board":
+        """
+        Returns an independent copy of this board, pieces included.
+
+        Nothing is rebuilt: the style strings, render templates and win lines
+        never change and are shared with the copy. Only the mutable game
+        state (cells, piece codes, bitboards, heights) is copied.
+        """
+        twin = self.__class__.__new__(self.__class__)
+        for name in Board.__slots__:
+            setattr(twin, name, getattr(self, name))
+        twin.board = self.board[:]
+        twin._codes = self._codes.copy()
+        twin._tokens = self._tokens.copy()
+        twin._bb = self._bb.copy()
+        twin._heights = self._heights.copy()
+        return twin
 
     # ────────────────────────────────────────────────────────────────
     # Rendering – prints each board row as three text lines
@@ -138,48 +204,41 @@ class Board:
         forming cells from the chosen style. Tokens are placed in the
         center of the middle line of each cell.
         """
-        top_part = self._parts["top"]
-        mid_part = self._parts["mid"]
-        bot_part = self._parts["bottom"]
-
-        center_idx = len(mid_part) // 2
-
-        # To ensure the board aligns nicely, we calculate the width of the row
-        # labels (e.g., "5: ") and add padding to lines that don't have a label.
-        row_label_width = len(str(self.rows - 1))
-        row_prefix_padding = " " * (row_label_width + 2)  # e.g., for "5: "
-
-        for r, logical_row in enumerate(self.board):
-            # Row label for the middle line, e.g., "0: ", "1: ", ...
-            row_label = f"{r:>{row_label_width}}: "
-
+        # Every string except the tokens is prebuilt, so a frame only fills
+        # the tokens into the middle lines; nothing is converted with str().
+        top_line = self._top_line
+        bot_line = self._bot_line
+        tokens_by_code = self._tokens
+
+        # All lines are collected first and written in one go, so the terminal
+        # receives a single block instead of one write per line.
+        lines: List[str] = []
+
+        w = self.columns
+        for r, row_label in enumerate(self._row_labels):
             # 1. Top line of a row of cells (with padding for row label)
-            print(row_prefix_padding + " ".join(top_part for _ in logical_row))
+            lines.append(top_line)
 
             # 2. Middle line, with tokens and row label.
-            rendered_mids = [
-                mid_part[:center_idx] + (str(c) if c is not None else " ") + mid_part[center_idx + 1:]
-                for c in logical_row
-            ]
-            print(row_label + " ".join(rendered_mids))
+            tokens = [tokens_by_code[code] for code in self.board[r * w:(r + 1) * w]]
+            lines.append(row_label + self._mid_template.format(*tokens))
 
             # 3. Bottom line of a row of cells (with padding for row label)
-            print(row_prefix_padding + " ".join(bot_part for _ in logical_row))
+            lines.append(bot_line)
             # optional spacer line between board rows:
-            # print()
+            # lines.append("")
 
-        # --- Column Index Footer ---
-        print()  # Add a blank line for spacing before the footer.
-        cell_width = len(mid_part)
-        # Center each column index within the width of a single cell.
-        col_labels = [str(c).center(cell_width) for c in range(self.columns)]
-        print(row_prefix_padding + " ".join(col_labels))
+        # --- Column Index Footer (prebuilt, starts with a blank line) ---
+        lines.append(self._footer)
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def drop_piece(self, column: int, piece: str) -> bool:
         """
         Drops a piece into the specified column, obeying gravity.
 
-        Checks from the bottom row up for the first empty slot.
+        The landing row comes straight from the column's stack height, so no
+        scanning is needed.
 
         Parameters
         ----------
@@ -197,69 +256,77 @@ class Board:
         if not 0 <= column < self.columns:
             return False  # Column index is out of bounds, drop is invalid.
 
-        # To simulate gravity, we check from the bottom row upwards.
-        # `range(self.rows - 1, -1, -1)` iterates from 5 down to 0 for a 6-row board.
-        for r in range(self.rows - 1, -1, -1):
-            if self.board[r][column] is None:
-                self.board[r][column] = piece
-                return True  # Piece successfully placed.
+        height = self._heights[column]
+        if height == self.rows:
+            return False  # The column is already full.
+
+        code = self._piece_code(piece)
 
-        return False  # If the loop completes, no empty slot was found.
+        # To simulate gravity, height 0 is the bottom row (index rows - 1).
+        self.board[(self.rows - 1 - height) * self.columns + column] = code
+        self._bb[code] |= 1 << (column * self._stride + height)
+        self._heights[column] = height + 1
+        return True  # Piece successfully placed.
 
     def check_for_win(self, piece: str) -> bool:
         """
         Checks the entire board for a winning sequence of 4 for the given piece.
 
-        Iterates through each cell. If a cell contains the target piece, it checks
-        for a win starting from that cell in all four primary directions
-        (horizontal, vertical, and both diagonals).
+        For every direction, ANDing the bitboard with itself shifted by one
+        step leaves bits that start a pair; repeating that with a shift of two
+        steps leaves bits that start a line of four.
         """
-        # Directions to check: (row_change, col_change)
-        directions = [
-            (0, 1),  # Horizontal
-            (1, 0),  # Vertical
-            (1, 1),  # Diagonal down-right
-            (1, -1),  # Diagonal down-left
-        ]
-
-        for r in range(self.rows):
-            for c in range(self.columns):
-                # We only need to start a check if the cell contains the piece
-                if self.board[r][c] == piece:
-                    for dr, dc in directions:
-                        # Check if a line of 4 would fit on the board from here
-                        end_r, end_c = r + 3 * dr, c + 3 * dc
-                        if not (0 <= end_r < self.rows and 0 <= end_c < self.columns):
-                            continue  # This line won't fit, try next direction
-
-                        # Check the 4 cells (start + 3 more) in the current direction.
-                        # `all()` is efficient: it stops checking as soon as one
-                        # element is not the piece (short-circuiting).
-                        if all(self.board[r + i * dr][c + i * dc] == piece for i in range(4)):
-                            return True  # Found a win
-
-        return False  # No win found after checking all possibilities
+        code = self._codes.get(piece)
+        if code is None:
+            return False  # This piece has never been dropped on the board.
+
+        bb = self._bb[code]
+        for shift in self._shifts:
+            pairs = bb & (bb >> shift)
+            if pairs & (pairs >> 2 * shift):
+                return True  # Found a win
+
+        return False  # No win found in any direction
 
     def reset_board(self):
         """
         Resets the board to its initial empty state.
 
-        This is done by creating a new 2D list filled with `None`.
+        The bytearray is zeroed in place by copying a prebuilt blank image
+        over it (a single memcpy, no new allocation), and the bitboards and
+        column heights are cleared. Piece codes are kept, so the same tokens
+        map to the same codes across games.
+        """
+        self.board[:] = self._blank
+        self._bb = [0] * len(self._bb)
+        self._heights = [0] * self.columns
+
+    def _piece_code(self, piece: str) -> int:
+        """
+        Returns the byte code stored on the board for *piece*.
+
+        Unknown pieces are assigned the next free code on first use.
         """
-        self.board = [
-            [None for _ in range(self.columns)] for _ in range(self.rows)
-        ]
+        code = self._codes.get(piece)
+        if code is None:
+            code = len(self._tokens)
+            if code > 255:
+                raise ValueError("A board cannot hold more than 255 distinct pieces.")
+            self._codes[piece] = code
+            self._tokens.append(piece)
+            self._bb.append(0)
+        return code
 
 # ──────────────────────────────────────────────────────────────────────
 # Hot-reload helper – call while program is running to pick up new JSON
 # ──────────────────────────────────────────────────────────────────────
 def reload_styles() -> None:
     """
-    Re-scans styles/cells/*.json and refreshes the shared style map in memory.
+    Discards the shared style map so styles/cells/*.json is re-scanned on next use.
 
     This is a development utility. It allows you to change the cell style JSON
     files and see the changes in a running application without restarting it,
     for example by calling this function from a special debug input.
     """
     global _STYLE_MAP
-    _STYLE_MAP = _load_cell_styles()
+    _STYLE_MAP = None
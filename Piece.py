@@ -1,10 +1,13 @@
-import json
 from pathlib import Path
 from typing import Dict, List, Optional
 
-STYLES_DIR = Path(__file__).parent / "styles"
+from StyleLoader import STYLES_DIR, load_style_dir
+
 PIECES_DIR = STYLES_DIR / "pieces"
 
+# Keys every piece style must define
+_REQUIRED_PIECE = frozenset(("one", "two"))
+
 
 def _load_piece_styles(directory: Path = PIECES_DIR) -> Dict[str, Dict[str, str]]:
     """
@@ -12,7 +15,7 @@ def _load_piece_styles(directory: Path = PIECES_DIR) -> Dict[str, Dict[str, str]
 
     This function scans a directory for *.json files to load piece styles,
     allowing player tokens (e.g., 'X' and 'O') to be easily customized.
-    It works just like the cell style loader.
+    It uses the same shared loader as the cell styles.
 
     Each JSON file in *directory* may be a single-style file or a
     multi-style bundle, similar to the cell style loader.
@@ -22,49 +25,19 @@ def _load_piece_styles(directory: Path = PIECES_DIR) -> Dict[str, Dict[str, str]
     * Every style dict must contain exactly the keys 'one', 'two'.
     * After scanning all files there must be a style named 'default'.
     """
-    if not directory.is_dir():
-        raise FileNotFoundError(f"Styles folder not found: {directory}")
-
-    required = {"one", "two"}
-    style_map: Dict[str, Dict[str, str]] = {}
-
-    for fp in directory.glob("*.json"):
-        with fp.open(encoding="UTF-8") as f:
-            data = json.load(f)
-
-        # ---- Case A: file defines ONE style (root has one/two) ----
-        if required.issubset(data):
-            style_name = fp.stem
-            if style_name in style_map:
-                raise ValueError(
-                    f"Duplicate piece style name '{style_name}' found again in {fp.name}"
-                )
-            style_map[style_name] = {k: data[k] for k in required}
-            continue
-
-        # ---- Case B: file bundles MANY styles ---------------------------
-        for style_name, parts in data.items():
-            if style_name in style_map:
-                raise ValueError(
-                    f"Duplicate piece style name '{style_name}' (also in {fp.name})"
-                )
-            missing = required - parts.keys()
-            if missing:
-                raise ValueError(
-                    f"Piece style '{style_name}' in {fp.name} missing keys: {', '.join(missing)}"
-                )
-            style_map[style_name] = {k: parts[k] for k in required}
-
-    if "default" not in style_map:
-        raise ValueError(
-            'At least one JSON in styles/pieces/ must provide a style named "default".'
-        )
-
-    return style_map
-
-
-# Parsed exactly once at import time
-_PIECE_STYLE_MAP: Dict[str, Dict[str, str]] = _load_piece_styles()
+    return load_style_dir(directory, _REQUIRED_PIECE, kind="piece style")
+
+
+# Parsed lazily on first use, so importing this module touches no files.
+_PIECE_STYLE_MAP: Optional[Dict[str, Dict[str, str]]] = None
+
+
+def _get_piece_style_map() -> Dict[str, Dict[str, str]]:
+    """Returns the shared piece style map, loading it on first access."""
+    global _PIECE_STYLE_MAP
+    if _PIECE_STYLE_MAP is None:
+        _PIECE_STYLE_MAP = _load_piece_styles()
+    return _PIECE_STYLE_MAP
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -81,17 +54,21 @@ class Piece:
         loaded piece styles. Defaults to 'default'.
     """
 
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access.
+    __slots__ = ("one", "two")
+
     def __init__(
         self,
         style: str = "default",
     ) -> None:
+        style_map = _get_piece_style_map()
         try:
             # Find the requested style definition from the globally loaded map.
-            style_def = _PIECE_STYLE_MAP[style]
+            style_def = style_map[style]
         except KeyError as exc:
             raise ValueError(
                 f"Unknown piece style '{style}'. "
-                f"Available: {', '.join(sorted(_PIECE_STYLE_MAP))}"
+                f"Available: {', '.join(sorted(style_map))}"
             ) from exc
 
         # Assign the specific characters for player one and player two.
@@ -108,11 +85,11 @@ class Piece:
 # ──────────────────────────────────────────────────────────────────────
 def reload_piece_styles() -> None:
     """
-    Re-scans styles/pieces/*.json and refreshes the shared style map in memory.
+    Discards the shared style map so styles/pieces/*.json is re-scanned on next use.
 
     This is a development utility. It allows you to change the piece style JSON
     files and see the changes in a running application without restarting it,
     for example by calling this function from a special debug input.
     """
     global _PIECE_STYLE_MAP
-    _PIECE_STYLE_MAP = _load_piece_styles()
\ No newline at end of file
+    _PIECE_STYLE_MAP = None
\ No newline at end of file
@@ -0,0 +1,77 @@
+# StyleLoader.py ── shared JSON style loader used by Board.py and Piece.py
+# ----------------------------------------------------------------------
+import json
+from pathlib import Path
+from typing import Dict, FrozenSet
+
+# orjson is an optional, faster drop-in for parsing the style files.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# ──────────────────────────────────────────────────────────────────────
+# Paths
+# ──────────────────────────────────────────────────────────────────────
+STYLES_DIR = Path(__file__).parent / "styles"
+
+
+def load_style_dir(
+    directory: Path,
+    required: FrozenSet[str],
+    kind: str = "style",
+) -> Dict[str, Dict[str, str]]:
+    """
+    Build a mapping of style_name → {key: str for key in *required*}.
+
+    Each JSON file in *directory* may be:
+      • a **single-style** file whose root holds all *required* keys
+        (the style name becomes the file's stem)
+      • OR a **multi-style** bundle mapping style names to such dicts.
+
+    *kind* names the styles in error messages (e.g. "style", "piece style").
+
+    Requirements
+    ------------
+    * Every style dict must contain all of the *required* keys.
+    * After scanning all files there must be a style named 'default'.
+    """
+    if not directory.is_dir():
+        raise FileNotFoundError(f"Styles folder not found: {directory}")
+
+    style_map: Dict[str, Dict[str, str]] = {}
+
+    for fp in sorted(directory.glob("*.json")):
+        data = _json_loads(fp.read_bytes())
+
+        # ---- Case A: file defines ONE style (root has every required key) ----
+        if required.issubset(data):
+            style_name = fp.stem
+            if style_name in style_map:
+                raise ValueError(
+                    f"Duplicate {kind} name '{style_name}' found again in {fp.name}"
+                )
+            style_map[style_name] = {k: data[k] for k in required}
+            continue
+
+        # ---- Case B: file bundles MANY styles ---------------------------
+        for style_name, parts in data.items():
+            if style_name in style_map:
+                raise ValueError(
+                    f"Duplicate {kind} name '{style_name}' (also in {fp.name})"
+                )
+            missing = required - parts.keys()
+            if missing:
+                raise ValueError(
+                    f"{kind.capitalize()} '{style_name}' in {fp.name} missing keys: {', '.join(missing)}"
+                )
+            style_map[style_name] = {k: parts[k] for k in required}
+
+    if "default" not in style_map:
+        raise ValueError(
+            f"At least one JSON in {directory.parent.name}/{directory.name}/ "
+            'must provide a style named "default".'
+        )
+
+    return style_map
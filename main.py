@@ -1,6 +1,15 @@
 import Board
 import Piece
 import os
+import sys
+
+# ANSI escape sequence: clear the screen and move the cursor to the top-left.
+# Writing it is much cheaper than starting a 'cls'/'clear' process every turn.
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# On Windows, running any command once enables ANSI escape handling in the console.
+if os.name == 'nt':
+    os.system('')
 
 # Create a Board object to hold the pieces in place.
 board = Board.Board("blue", 6, 7, style="default")
@@ -23,7 +32,7 @@ current_piece = pieces.one
 game_is_on = True
 
 while game_is_on:
-    os.system('cls' if os.name == 'nt' else 'clear')
+    sys.stdout.write(CLEAR_SCREEN)
     board.print_board()
 
     print(f"\nPlayer {current_player}'s turn ({current_piece})")
@@ -36,7 +45,7 @@ while game_is_on:
 
     if board.drop_piece(choice, current_piece):
         if board.check_for_win(current_piece):
-            os.system('cls' if os.name == 'nt' else 'clear')
+            sys.stdout.write(CLEAR_SCREEN)
             print(f"{current_piece} won!")
             board.print_board()
             input("enter for next game, ctrl-c to quit")